@@ -14,12 +14,17 @@ import glob
 import re
 import base64
 import platform
+import numpy as np
 import pandas as pd
 import pickle
 import random
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
@@ -27,8 +32,10 @@ from selenium.webdriver.support import expected_conditions as EC
 # 주석 처리: 웹드라이버 매니저를 사용하지 않음
 # from webdriver_manager.chrome import ChromeDriverManager 
 
+import httplib2
 from googleapiclient.discovery import build
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 
 # macOS 키체인
 try:
@@ -36,6 +43,57 @@ try:
 except ImportError:
     keyring = None  # CI 환경에서는 keyring 모듈이 없어도 됨
 
+# Chrome 프로세스 메모리 측정
+try:
+    import psutil
+except ImportError:
+    psutil = None  # 없으면 RSS 측정만 건너뜀
+
+# ------------------------------------------------
+# 0. 실행 시간 예산 (전체 실행 공통 마감 시각)
+# ------------------------------------------------
+RUN_BUDGET_SEC = float(os.getenv("LINKEDIN_RUN_BUDGET_SEC") or 900)
+
+class DeadlineExceeded(BaseException):
+    """예산 소진 시 발생. 넓은 except Exception 블록에 삼켜지지 않도록 BaseException 상속."""
+
+    def __init__(self, stage: str):
+        super().__init__(f"실행 시간 예산 초과 (단계: {stage})")
+        self.stage = stage
+
+class RunDeadline:
+    """실행 시작 시 한 번 만들어 모든 대기/드라이버/시트 호출에 넘기는 마감 시각."""
+
+    def __init__(self, budget_sec: float | None):
+        self.budget_sec = budget_sec
+        self.expires_at = time.monotonic() + budget_sec if budget_sec else None
+        self.exceeded   = []  # (대상, 단계)
+        self._lock      = threading.Lock()
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return float("inf")
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self, stage: str):
+        if self.remaining() <= 0:
+            raise DeadlineExceeded(stage)
+
+    def timeout(self, requested: float, stage: str) -> float:
+        """요청한 타임아웃을 남은 예산으로 잘라 돌려줍니다."""
+        self.check(stage)
+        return min(requested, self.remaining())
+
+    def sleep(self, seconds: float, stage: str):
+        time.sleep(self.timeout(seconds, stage))
+        self.check(stage)
+
+    def record(self, label: str, stage: str):
+        with self._lock:
+            self.exceeded.append((label, stage))
+
+NO_DEADLINE = RunDeadline(None)
+
 # ------------------------------------------------
 # 1. Google Service Account 인증
 # ------------------------------------------------
@@ -61,31 +119,130 @@ service = build('sheets', 'v4', credentials=creds)
 SPREADSHEET_ID = '1fQTqTrNGwSNGi9EzyK8A2ZqU48IbXG-YrL2ImhXm74w'
 SHEET_NAME     = '시트4'
 
+SHEETS_TIMEOUT = 60
+
+# googleapiclient(httplib2) 는 스레드 안전하지 않으므로 공유 클라이언트 호출을 직렬화
+SHEETS_LOCK = threading.Lock()
+
+def sheets_execute(request, deadline: RunDeadline = NO_DEADLINE, stage: str = "sheets"):
+    """요청 전체를 남은 예산 안에서만 기다립니다.
+
+    httplib2 타임아웃은 소켓 연산 하나하나에만 걸리므로, 요청은 별도 스레드에서
+    (요청 전용 HTTP 객체로) 실행하고 호출 쪽에서 남은 예산만큼만 기다립니다.
+    """
+    if not SHEETS_LOCK.acquire(timeout=deadline.timeout(SHEETS_TIMEOUT, stage)):
+        deadline.check(stage)
+        raise TimeoutError(f"Sheets 클라이언트 대기 시간 초과 ({stage})")
+    try:
+        timeout = deadline.timeout(SHEETS_TIMEOUT, stage)
+        http = AuthorizedHttp(creds, http=httplib2.Http(timeout=timeout))
+        outcome = {}
+
+        def call():
+            try:
+                outcome["value"] = request.execute(http=http)
+            except Exception as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=call, name="sheets-request", daemon=True)
+        worker.start()
+        worker.join(timeout)
+    finally:
+        SHEETS_LOCK.release()
+
+    if worker.is_alive():
+        deadline.check(stage)
+        raise TimeoutError(f"Sheets 요청 시간 초과 ({stage})")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
 # ------------------------------------------------
 # 2. LinkedIn 로그인 정보
 # ------------------------------------------------
-def get_linkedin_credentials():
-    email    = os.getenv("LINKEDIN_EMAIL")
-    password = os.getenv("LINKEDIN_PASSWORD")
+def get_linkedin_credentials(email_env="LINKEDIN_EMAIL", password_env="LINKEDIN_PASSWORD",
+                             keychain_service="LinkedIn"):
+    email    = os.getenv(email_env)
+    password = os.getenv(password_env)
 
     if platform.system() == "Darwin" and keyring:
         try:
             if not email:
-                email = keyring.get_password("LinkedIn", "email")
+                email = keyring.get_password(keychain_service, "email")
             if not password:
-                password = keyring.get_password("LinkedIn", "password")
+                password = keyring.get_password(keychain_service, "password")
         except Exception as e:
             print("[WARN] 키체인 읽기 실패:", e)
     return email, password
 
+# ------------------------------------------------
+# 2-1. 계정/시트 대상 목록
+# ------------------------------------------------
+# 예) linkedin_targets.json
+# [
+#   {"name": "alice", "spreadsheet_id": "...", "sheet_name": "시트4",
+#    "email_env": "ALICE_LINKEDIN_EMAIL", "password_env": "ALICE_LINKEDIN_PASSWORD",
+#    "keychain_service": "LinkedIn-alice", "cookie_file": "alice_cookies.pkl"}
+# ]
+# email_env / password_env / keychain_service 를 생략하면 이름에서 만듭니다.
+#   (alice → LINKEDIN_EMAIL_ALICE / LINKEDIN_PASSWORD_ALICE / LinkedIn-alice)
+#   기본 계정(LINKEDIN_EMAIL)으로 조용히 대체되면 여러 대상이 같은 계정으로 로그인하게 됨
+TARGETS_FILE = os.getenv("LINKEDIN_TARGETS_FILE", "linkedin_targets.json")
+MAX_WORKERS  = int(os.getenv("LINKEDIN_MAX_WORKERS") or 0)  # 0이면 대상 수만큼
+
+def load_targets(base_download_dir: str, path: str = TARGETS_FILE) -> list[dict]:
+    """대상 목록을 읽어 기본값을 채웁니다. 파일이 없으면 기존 단일 계정/시트를 사용합니다."""
+    if not os.path.exists(path):
+        return [{
+            "name": "default",
+            "spreadsheet_id": SPREADSHEET_ID,
+            "sheet_name": SHEET_NAME,
+            "email_env": "LINKEDIN_EMAIL",
+            "password_env": "LINKEDIN_PASSWORD",
+            "keychain_service": "LinkedIn",
+            "cookie_file": "linkedin_cookies.pkl",
+            "download_dir": base_download_dir,
+        }]
+
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    if isinstance(raw, dict):
+        raw = raw.get("targets", [])
+    if not raw:
+        raise ValueError(f"대상 목록이 비어 있습니다: {path}")
+
+    targets = []
+    for i, entry in enumerate(raw):
+        name = entry.get("name") or f"target{i + 1}"
+        if not entry.get("spreadsheet_id"):
+            raise ValueError(f"대상 '{name}'에 spreadsheet_id가 없습니다.")
+        if any(t["name"] == name for t in targets):
+            raise ValueError(f"대상 이름이 중복되었습니다: {name}")
+        env_suffix = re.sub(r"\W", "_", name).upper()
+        targets.append({
+            "name": name,
+            "spreadsheet_id": entry["spreadsheet_id"],
+            "sheet_name": entry.get("sheet_name", SHEET_NAME),
+            "email_env": entry.get("email_env", f"LINKEDIN_EMAIL_{env_suffix}"),
+            "password_env": entry.get("password_env", f"LINKEDIN_PASSWORD_{env_suffix}"),
+            "keychain_service": entry.get("keychain_service", f"LinkedIn-{name}"),
+            "cookie_file": entry.get("cookie_file", f"linkedin_cookies_{name}.pkl"),
+            # 계정별 다운로드 폴더로 분리해야 다른 계정의 XLSX를 집어가지 않음
+            "download_dir": entry.get("download_dir",
+                                      os.path.join(base_download_dir, f"linkedin_{name}")),
+        })
+    print(f"[INFO] 대상 {len(targets)}개 로드: {path}")
+    return targets
+
 # ------------------------------------------------
 # 3. 스프레드시트 유틸
 # ------------------------------------------------
-def get_analytics_url() -> str | None:
-    cell = f"{SHEET_NAME}!C2"
-    values = service.spreadsheets().values().get(
-        spreadsheetId=SPREADSHEET_ID, range=cell
-    ).execute().get("values", [])
+def get_analytics_url(spreadsheet_id=SPREADSHEET_ID, sheet_name=SHEET_NAME,
+                      deadline: RunDeadline = NO_DEADLINE) -> str | None:
+    cell = f"{sheet_name}!C2"
+    values = sheets_execute(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=cell
+    ), deadline, "analytics_url").get("values", [])
     if not values:
         print("C2 셀에 URL이 없습니다.")
         return None
@@ -97,17 +254,25 @@ def get_analytics_url() -> str | None:
     print("URL 형식이 잘못되었습니다. 예) urn:li:activity:1234567890")
     return None
 
-def get_next_row_index() -> int:
-    rng = f"{SHEET_NAME}!C4:C"
-    rows = service.spreadsheets().values().get(
-        spreadsheetId=SPREADSHEET_ID, range=rng, majorDimension='ROWS'
-    ).execute().get('values', [])
+def get_next_row_index(spreadsheet_id=SPREADSHEET_ID, sheet_name=SHEET_NAME,
+                       deadline: RunDeadline = NO_DEADLINE) -> int:
+    rng = f"{sheet_name}!C4:C"
+    rows = sheets_execute(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=rng, majorDimension='ROWS'
+    ), deadline, "next_row").get('values', [])
     return 4 + len(rows)
 
 # ------------------------------------------------
 # 4. Selenium 웹드라이버 (로컬 + CI 공통) - 개선됨
 # ------------------------------------------------
-def init_driver(download_dir: str) -> webdriver.Chrome:
+LOW_MEMORY_MODE   = os.getenv("LINKEDIN_LOW_MEMORY", "").strip().lower() in ("1", "true", "yes")
+MEMORY_BUDGET_MB  = float(os.getenv("LINKEDIN_MEMORY_BUDGET_MB") or 0)  # 0이면 제한 없음
+MEMORY_SAMPLE_SEC = float(os.getenv("LINKEDIN_MEMORY_SAMPLE_SEC") or 5)
+
+DRIVER_INSTALL_LOCK = threading.Lock()
+
+def init_driver(download_dir: str, low_memory: bool = LOW_MEMORY_MODE,
+                debug_port: int = 9222, on_service=None) -> webdriver.Chrome:
     chrome_options = Options()
     # CI 환경(Linux)에서만 chromium-browser 사용
     if platform.system() == "Linux":
@@ -117,10 +282,27 @@ def init_driver(download_dir: str) -> webdriver.Chrome:
     chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--start-maximized")  # 창 최대화
-    chrome_options.add_argument("--window-size=1920,1080")
+    if low_memory:
+        # 저메모리 모드: 작은 뷰포트 + 렌더러 프로세스 수 제한
+        print("[INFO] 저메모리 Chrome 모드 사용")
+        chrome_options.add_argument("--window-size=1280,720")
+        chrome_options.add_argument("--renderer-process-limit=2")
+        chrome_options.add_argument("--process-per-site")
+        chrome_options.add_argument("--disable-site-isolation-trials")
+        chrome_options.add_argument("--disable-features=SitePerProcess,IsolateOrigins,BackForwardCache,Translate,MediaRouter,OptimizationHints")
+        chrome_options.add_argument("--js-flags=--max-old-space-size=512")
+        chrome_options.add_argument("--aggressive-cache-discard")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    else:
+        chrome_options.add_argument("--start-maximized")  # 창 최대화
+        chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--remote-debugging-port=9222")
+    # 동시에 여러 Chrome 을 띄울 수 있도록 계정별 포트 사용
+    chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
     chrome_options.add_argument("--disable-extensions")
     
     # 봇 탐지 방지 추가 설정
@@ -166,8 +348,13 @@ def init_driver(download_dir: str) -> webdriver.Chrome:
         service_obj = Service('/usr/local/bin/chromedriver')
     else:
         # 로컬 환경에서는 webdriver-manager를 시도할 수 있음
+        # (공유 캐시/drivers.json 을 잠금 없이 갱신하므로 동시 실행 대상끼리 직렬화)
         from webdriver_manager.chrome import ChromeDriverManager
-        service_obj = Service(ChromeDriverManager().install())
+        with DRIVER_INSTALL_LOCK:
+            driver_path = ChromeDriverManager().install()
+        service_obj = Service(driver_path)
+    if on_service:
+        on_service(service_obj)  # 기동이 멈췄을 때 chromedriver 프로세스를 정리할 수 있도록
     
     driver = webdriver.Chrome(service=service_obj, options=chrome_options)
     
@@ -176,17 +363,272 @@ def init_driver(download_dir: str) -> webdriver.Chrome:
     
     return driver
 
+DRIVER_CALL_TIMEOUT  = 120
+DRIVER_START_TIMEOUT = 120
+DRIVER_QUIT_TIMEOUT  = 15
+DRIVER_REAP_GRACE    = 10
+
+# 예산 초과로 기다리기를 포기한 드라이버 기동 (스레드, 상태)
+ABANDONED_DRIVER_STARTS = []
+
+def bind_driver_deadline(driver, deadline: RunDeadline, stage: str):
+    """드라이버가 보내는 모든 명령에 남은 예산을 적용하고, 초과 시 보고할 현재 단계를 갱신합니다.
+
+    명령을 보낼 때마다 그 시점의 남은 예산으로 HTTP 응답 대기(ClientConfig.timeout, Selenium 이
+    요청마다 읽음)를 다시 계산하고, 페이지 이동 직전에는 페이지 로드 타임아웃도 다시 맞춥니다.
+    종료(quit)는 예산이 바닥나도 정리가 되도록 짧은 고정 타임아웃으로 보냅니다.
+    """
+    executor = driver.command_executor
+    executor.deadline_stage = stage
+    if getattr(executor, "run_deadline", None) is None:
+        executor.run_deadline = deadline
+        config = getattr(executor, "client_config", None) or executor._client_config
+        send = executor.execute
+
+        def execute_within_deadline(command, params):
+            if command == Command.QUIT:
+                config.timeout = DRIVER_QUIT_TIMEOUT
+                return send(command, params)
+            remaining = deadline.timeout(DRIVER_CALL_TIMEOUT, executor.deadline_stage)
+            config.timeout = remaining
+            if command == Command.GET:
+                send(Command.SET_TIMEOUTS, {"pageLoad": int(remaining * 1000)})
+            return send(command, params)
+
+        executor.execute = execute_within_deadline
+
+    driver.set_script_timeout(deadline.timeout(DRIVER_CALL_TIMEOUT, stage))
+
+def init_driver_within(deadline: RunDeadline, stage: str, download_dir: str, **driver_kwargs):
+    """드라이버 기동(ChromeDriverManager 다운로드 포함)을 남은 예산 안에서만 기다립니다.
+
+    예산 안에 뜨지 않으면 포기하고, 나중에라도 뜬 드라이버는 기동 스레드가 바로 종료합니다.
+    포기한 기동은 ABANDONED_DRIVER_STARTS 에 남겨 main() 종료 전에 reap_abandoned_driver_starts 로 정리합니다.
+    """
+    state = {}
+    lock  = threading.Lock()
+
+    def remember_service(service_obj):
+        state["service"] = service_obj
+
+    def start():
+        try:
+            driver = init_driver(download_dir, on_service=remember_service, **driver_kwargs)
+        except Exception as e:
+            state["error"] = e
+            return
+        with lock:
+            if state.get("abandoned"):
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                return
+            state["driver"] = driver
+
+    thread = threading.Thread(target=start, name="driver-start", daemon=True)
+    thread.start()
+    thread.join(deadline.timeout(DRIVER_START_TIMEOUT, stage))
+    with lock:
+        if "driver" in state:
+            driver = state["driver"]
+        elif "error" in state:
+            raise state["error"]
+        else:
+            state["abandoned"] = True
+            ABANDONED_DRIVER_STARTS.append((thread, state))
+            deadline.check(stage)
+            raise TimeoutError(f"드라이버 시작 시간 초과 ({stage})")
+    try:
+        bind_driver_deadline(driver, deadline, stage)
+    except BaseException:
+        driver.quit()
+        raise
+    return driver
+
+def _kill_process_tree(process):
+    if process is None:
+        return
+    if psutil is None:
+        process.kill()
+        return
+    try:
+        root = psutil.Process(process.pid)
+        procs = root.children(recursive=True) + [root]
+    except psutil.Error:
+        return
+    for proc in procs:
+        try:
+            proc.kill()
+        except psutil.Error:
+            pass
+
+def reap_abandoned_driver_starts(grace: float = DRIVER_REAP_GRACE):
+    """포기한 드라이버 기동을 잠시 기다려 정리하고, 그래도 끝나지 않으면 프로세스 트리를 종료합니다.
+
+    기동 스레드는 daemon 이라 인터프리터 종료 시 그냥 사라지므로, 그 뒤에 뜬 Chrome 이
+    러너에 남지 않도록 종료 직전에 호출해야 합니다.
+    """
+    until = time.monotonic() + grace
+    for thread, state in ABANDONED_DRIVER_STARTS:
+        thread.join(max(0.0, until - time.monotonic()))
+        if not thread.is_alive():
+            continue
+        process = getattr(state.get("service"), "process", None)
+        print(f"[WARN] 드라이버 기동이 끝나지 않아 강제 종료합니다 (pid {getattr(process, 'pid', None)})")
+        try:
+            _kill_process_tree(process)
+        except Exception as e:
+            print(f"[WARN] 드라이버 프로세스 종료 실패: {e}")
+
+# ------------------------------------------------
+# 4-1. Chrome 메모리 측정 및 드라이버 재시작
+# ------------------------------------------------
+class CombinedMemoryPeak:
+    """동시에 실행 중인 모니터들의 최근 RSS 합계와 그 최대값을 추적합니다 (호스트/동시성 산정용)."""
+
+    def __init__(self):
+        self.peak_rss_mb = 0.0
+        self._current    = {}
+        self._lock       = threading.Lock()
+
+    def update(self, key, rss_mb: float):
+        with self._lock:
+            self._current[key] = rss_mb
+            self.peak_rss_mb = max(self.peak_rss_mb, sum(self._current.values()))
+
+    def remove(self, key):
+        with self._lock:
+            self._current.pop(key, None)
+
+class ChromeMemoryMonitor:
+    """chromedriver 와 하위 Chrome 프로세스 트리 전체의 RSS를 주기적으로 측정합니다."""
+
+    def __init__(self, budget_mb: float = MEMORY_BUDGET_MB, interval: float = MEMORY_SAMPLE_SEC,
+                 combined: CombinedMemoryPeak | None = None):
+        self.budget_mb     = budget_mb
+        self.combined      = combined
+        self.interval      = interval
+        self.peak_rss_mb   = 0.0
+        self.last_rss_mb   = 0.0
+        self.recycle_count = 0
+        self._pid          = None
+        self._lock         = threading.Lock()
+        self._over_budget  = threading.Event()
+        self._stop         = threading.Event()
+        self._thread       = None
+
+    def attach(self, driver):
+        """측정 대상을 (새) 드라이버의 프로세스 트리로 바꿉니다."""
+        process = getattr(getattr(driver, "service", None), "process", None)
+        with self._lock:
+            self._pid = getattr(process, "pid", None)
+        self._over_budget.clear()
+
+        if psutil is None:
+            print("[WARN] psutil 모듈이 없어 Chrome 메모리 측정을 건너뜁니다.")
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="chrome-rss", daemon=True)
+            self._thread.start()
+
+    def sample(self) -> float:
+        """현재 프로세스 트리의 RSS 합계(MB)를 측정하고 최대값/예산 초과 여부를 갱신합니다."""
+        with self._lock:
+            pid = self._pid
+        if psutil is None or not pid:
+            return 0.0
+
+        try:
+            root  = psutil.Process(pid)
+            procs = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return 0.0
+
+        total = 0
+        for proc in procs:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                pass  # 측정 중 종료된 렌더러 프로세스
+
+        rss_mb = total / (1024 * 1024)
+        with self._lock:
+            self.last_rss_mb = rss_mb
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+        if self.combined is not None:
+            self.combined.update(id(self), rss_mb)
+        if self.budget_mb and rss_mb > self.budget_mb:
+            self._over_budget.set()
+        return rss_mb
+
+    def over_budget(self) -> bool:
+        return self._over_budget.is_set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+        if self.combined is not None:
+            self.combined.remove(id(self))  # 끝난 대상은 합계에서 제외
+
+    def report(self, label: str = ""):
+        budget = f"{self.budget_mb:.0f} MB" if self.budget_mb else "없음"
+        prefix = f"[{label}] " if label else ""
+        print(f"[INFO] {prefix}Chrome 메모리: 최대 RSS {self.peak_rss_mb:.1f} MB, "
+              f"예산 {budget}, 드라이버 재시작 {self.recycle_count}회")
+
+def recycle_driver_if_needed(driver, monitor: ChromeMemoryMonitor, download_dir: str,
+                             cookie_path: str = "linkedin_cookies.pkl",
+                             deadline: RunDeadline = NO_DEADLINE, **driver_kwargs):
+    """메모리 예산을 초과했으면 세션(쿠키)을 유지한 채 드라이버를 새로 띄웁니다."""
+    monitor.sample()
+    if not monitor.over_budget():
+        return driver
+    deadline.check("driver_recycle")
+
+    print(f"[WARN] Chrome 메모리 예산 초과 ({monitor.last_rss_mb:.1f} MB > "
+          f"{monitor.budget_mb:.0f} MB), 드라이버 재시작")
+    current_url = driver.current_url
+    save_cookies(driver, cookie_path)
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"[WARN] 기존 드라이버 종료 실패: {e}")
+
+    new_driver = init_driver_within(deadline, "driver_recycle", download_dir, **driver_kwargs)
+    monitor.recycle_count += 1
+    monitor.attach(new_driver)
+    try:
+        load_cookies(new_driver, cookie_path)
+        if current_url.startswith("http"):
+            new_driver.get(current_url)
+    except BaseException:
+        # 호출자는 이미 종료된 기존 드라이버만 들고 있으므로 새 Chrome 을 여기서 정리
+        # (DeadlineExceeded 는 BaseException 이므로 함께 처리)
+        try:
+            new_driver.quit()
+        except Exception:
+            pass
+        raise
+    return new_driver
+
 # ------------------------------------------------
 # 5. LinkedIn 로그인 (기존 함수 유지)
 # ------------------------------------------------
-def login_linkedin(driver: webdriver.Chrome) -> bool:
-    email, pwd = get_linkedin_credentials()
+def login_linkedin(driver: webdriver.Chrome, credentials: tuple | None = None,
+                   deadline: RunDeadline = NO_DEADLINE) -> bool:
+    email, pwd = credentials or get_linkedin_credentials()
     if not email or not pwd:
         print("[ERROR] LinkedIn 로그인 정보가 없습니다.")
         return False
 
     driver.get("https://www.linkedin.com/login")
-    time.sleep(2)
+    deadline.sleep(2, "login")
     try:
         driver.find_element(By.ID, "username").send_keys(email)
         driver.find_element(By.ID, "password").send_keys(pwd)
@@ -195,15 +637,15 @@ def login_linkedin(driver: webdriver.Chrome) -> bool:
         print("로그인 오류:", e)
         return False
 
-    time.sleep(3)
+    deadline.sleep(3, "login")
     return True
 
 # ------------------------------------------------
 # 6. 로그인 후 인증 확인 (새 함수 추가)
 # ------------------------------------------------
-def handle_login_verification(driver):
+def handle_login_verification(driver, deadline: RunDeadline = NO_DEADLINE, file_prefix: str = ""):
     """로그인 후 추가 인증 또는 보안 확인 페이지 처리"""
-    time.sleep(5)  # 페이지 로드 대기
+    deadline.sleep(5, "security_check")  # 페이지 로드 대기
     
     # CAPTCHA 또는 보안 확인 감지
     security_prompts = [
@@ -218,14 +660,14 @@ def handle_login_verification(driver):
     for prompt in security_prompts:
         if prompt in page_source:
             print(f"[WARN] 보안 확인 감지: '{prompt}'")
-            driver.save_screenshot("security_challenge.png")
+            driver.save_screenshot(f"{file_prefix}security_challenge.png")
             return False
     
     # 현재 URL 확인
     current_url = driver.current_url
     if "checkpoint" in current_url or "security-verification" in current_url:
         print(f"[WARN] 보안 검증 URL 감지: {current_url}")
-        driver.save_screenshot("security_url.png")
+        driver.save_screenshot(f"{file_prefix}security_url.png")
         return False
     
     # LinkedIn 홈페이지 확인
@@ -238,13 +680,14 @@ def handle_login_verification(driver):
 # ------------------------------------------------
 # 7. Analytics 페이지 대기 (새 함수 추가)
 # ------------------------------------------------
-def wait_for_analytics_page(driver, timeout=90):
+def wait_for_analytics_page(driver, timeout=90, deadline: RunDeadline = NO_DEADLINE,
+                            file_prefix: str = ""):
     """Analytics 페이지가 로드될 때까지 기다립니다."""
     print("[INFO] Analytics 페이지 로드 대기...")
     
     try:
         # 더 긴 타임아웃과 명시적 대기 조건
-        WebDriverWait(driver, timeout).until(
+        WebDriverWait(driver, deadline.timeout(timeout, "analytics_page")).until(
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
         
@@ -260,15 +703,16 @@ def wait_for_analytics_page(driver, timeout=90):
         
         for selector in selectors:
             try:
-                WebDriverWait(driver, 10).until(
+                WebDriverWait(driver, deadline.timeout(10, "analytics_page")).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                 )
                 print(f"[INFO] 발견된 Analytics 요소: {selector}")
                 return True
-            except:
+            except Exception:
                 pass
         
         # JavaScript로 페이지 상태 확인
+        deadline.check("analytics_page")
         js_result = driver.execute_script("""
             return {
                 title: document.title,
@@ -282,7 +726,7 @@ def wait_for_analytics_page(driver, timeout=90):
         print(f"[DEBUG] 페이지 상태: {js_result}")
         
         # 페이지 소스 저장 (디버깅용)
-        with open("page_source.html", "w", encoding="utf-8") as f:
+        with open(f"{file_prefix}page_source.html", "w", encoding="utf-8") as f:
             f.write(driver.page_source)
         
         return js_result.get('hasAnalyticsContent', False)
@@ -294,13 +738,13 @@ def wait_for_analytics_page(driver, timeout=90):
 # ------------------------------------------------
 # 8. 페이지 로드 대기 (기존 함수 유지)
 # ------------------------------------------------
-def wait_for_page_load(driver, timeout=60):
+def wait_for_page_load(driver, timeout=60, deadline: RunDeadline = NO_DEADLINE):
     """페이지가 완전히 로드될 때까지 기다립니다."""
     print("[INFO] 페이지 로딩 대기 시작...")
     
     # 먼저 document.readyState 확인
     try:
-        WebDriverWait(driver, timeout).until(
+        WebDriverWait(driver, deadline.timeout(timeout, "page_load")).until(
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
         print("[INFO] 문서 로드 완료 (readyState: complete)")
@@ -308,11 +752,11 @@ def wait_for_page_load(driver, timeout=60):
         print(f"[WARN] 문서 로드 대기 실패: {e}")
     
     # 추가 대기 (AJAX 완료를 위해)
-    time.sleep(5)
+    deadline.sleep(5, "page_load")
     
     # LinkedIn 페이지 특정 요소 확인
     try:
-        WebDriverWait(driver, timeout).until(
+        WebDriverWait(driver, deadline.timeout(timeout, "page_load")).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "main.scaffold-layout__main, div.scaffold-layout__main"))
         )
         print("[INFO] LinkedIn 메인 컨테이너 감지됨")
@@ -322,16 +766,16 @@ def wait_for_page_load(driver, timeout=60):
     # 추가 스크롤 시도 (AJAX 콘텐츠 로드 유도)
     try:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-        time.sleep(2)
+        deadline.sleep(2, "page_load")
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
+        deadline.sleep(2, "page_load")
         driver.execute_script("window.scrollTo(0, 0);")
         print("[INFO] 페이지 스크롤 수행")
     except Exception as e:
         print(f"[WARN] 스크롤 시도 실패: {e}")
     
     # 최종 대기
-    time.sleep(5)
+    deadline.sleep(5, "page_load")
     
     return True
 
@@ -449,8 +893,9 @@ def find_download_button(driver):
 # ------------------------------------------------
 # 11. 다운로드 실행 (기존 함수 유지)
 # ------------------------------------------------
-def execute_download(driver, download_button=None):
+def execute_download(driver, download_button=None, deadline: RunDeadline = NO_DEADLINE):
     """다운로드 버튼을 찾고 클릭합니다."""
+    deadline.check("download")
     if not download_button:
         download_button = find_download_button(driver)
 
@@ -458,7 +903,7 @@ def execute_download(driver, download_button=None):
         try:
             # 요소가 보이도록 스크롤
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", download_button)
-            time.sleep(2)
+            deadline.sleep(2, "download")
             
             # 클릭 시도
             try:
@@ -470,7 +915,7 @@ def execute_download(driver, download_button=None):
                 print("[INFO] 다운로드 버튼 클릭 성공 (JavaScript 클릭)")
             
             # 다운로드 대기
-            time.sleep(10)
+            deadline.sleep(10, "download")
             return True
         except Exception as e:
             print(f"[ERROR] 다운로드 버튼 클릭 실패: {e}")
@@ -509,7 +954,7 @@ def execute_download(driver, download_button=None):
         """)
         print(f"[DEBUG] JavaScript 다운로드 시도 결과: {result}")
         if result:
-            time.sleep(10)
+            deadline.sleep(10, "download")
             return True
     except Exception as e:
         print(f"[ERROR] JavaScript 다운로드 시도 실패: {e}")
@@ -576,18 +1021,173 @@ def parse_excel(path: str):
 # ------------------------------------------------
 # 13. 스프레드시트 기록 (기존 함수 유지)
 # ------------------------------------------------
-def write_metrics_to_sheet(exposure, reached, reactions, comments, reposts, row_idx: int):
-    rng = f"{SHEET_NAME}!C{row_idx}:G{row_idx}"
-    service.spreadsheets().values().update(
-        spreadsheetId=SPREADSHEET_ID, range=rng, valueInputOption='USER_ENTERED',
-        body={'values': [[exposure, reached, reactions, comments, reposts]]}
-    ).execute()
+def metrics_range_update(sheet_name, exposure, reached, reactions, comments, reposts, row_idx: int) -> dict:
+    return {
+        'range': f"{sheet_name}!C{row_idx}:G{row_idx}",
+        'values': [[exposure, reached, reactions, comments, reposts]],
+    }
+
+def post_time_range_update(sheet_name, post_time: str) -> dict:
+    return {'range': f"{sheet_name}!G2", 'values': [[post_time]]}
+
+def collection_range_update(sheet_name, collected_at: str, activity_urn: str, row_idx: int) -> dict:
+    # 활동 ID 는 숫자로 쓰면 자릿수가 잘리므로 urn 문자열 그대로 기록
+    return {'range': f"{sheet_name}!M{row_idx}:N{row_idx}", 'values': [[collected_at, activity_urn]]}
+
+def write_updates_to_sheets(updates: dict[str, list[dict]], deadline: RunDeadline = NO_DEADLINE,
+                            written: set | None = None):
+    """스프레드시트별로 모인 범위 업데이트를 batchUpdate 한 번으로 기록합니다.
+
+    written 을 넘기면 기록을 마친 스프레드시트 ID를 채워, 중간에 실패해도 어디까지 썼는지 알 수 있습니다.
+    """
+    for spreadsheet_id, data in updates.items():
+        if not data:
+            continue
+        sheets_execute(service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={'valueInputOption': 'USER_ENTERED', 'data': data}
+        ), deadline, "sheets_write")
+        if written is not None:
+            written.add(spreadsheet_id)
+        print(f"[INFO] 시트 일괄 기록: {spreadsheet_id} ({len(data)}개 범위)")
+
+def write_results_to_sheets(results: list[dict], deadline: RunDeadline = NO_DEADLINE,
+                            written: set | None = None) -> list[dict]:
+    """수집 결과를 모아 기록합니다. 같은 시트를 쓰는 대상은 연속된 행을 배정받습니다."""
+    next_rows = {}
+    updates = {}
+    for result in results:
+        target = result["target"]
+        key = (target["spreadsheet_id"], target["sheet_name"])
+        if key not in next_rows:
+            next_rows[key] = get_next_row_index(*key, deadline=deadline)
+        row = next_rows[key]
+        next_rows[key] += 1
+        result["row"] = row
+
+        data = updates.setdefault(target["spreadsheet_id"], [])
+        data.append(metrics_range_update(target["sheet_name"], *result["metrics"], row))
+        data.append(post_time_range_update(target["sheet_name"], result["post_time"]))
+        data.append(collection_range_update(target["sheet_name"], result["collected_at"],
+                                            result["activity_urn"], row))
+
+    write_updates_to_sheets(updates, deadline, written)
+    return results
+
+# ------------------------------------------------
+# 13-1. 파생 지표 (참여율 / 시간당 증감 / 성장률)
+# ------------------------------------------------
+RAW_COLUMNS        = ["exposure", "reached", "reactions", "comments", "reposts"]   # C:G
+DERIVED_COLUMNS    = ["engagement_rate", "exposure_per_hour", "reached_per_hour",
+                      "engagement_per_hour", "exposure_growth_per_hour"]           # H:L
+COLLECTION_COLUMNS = ["collected_at", "activity_urn"]                             # M:N
+
+def _collected_hours(collected: pd.Series) -> pd.Series:
+    """수집 시각을 시간 단위 숫자로 바꿉니다. 시트 날짜(1899-12-30 기준 일수)와 문자열 모두 처리."""
+    serial = pd.to_numeric(collected, errors="coerce")
+    parsed = pd.to_datetime(collected.where(serial.isna()), format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    from_text = (parsed - pd.Timestamp("1899-12-30")) / pd.Timedelta(days=1)
+    return serial.fillna(from_text) * 24
+
+def compute_derived_metrics(raw: pd.DataFrame) -> pd.DataFrame:
+    """수집 이력(행 = 수집 시점)에서 파생 지표를 벡터 연산으로 계산합니다.
+
+    값이 비었거나 숫자가 아닌 행, 노출이 0인 행의 참여율처럼 정의되지 않는 값은
+    0으로 채우지 않고 NaN(시트에는 빈 칸)으로 둡니다.
+    증감/성장률은 같은 포스트(activity_urn)의 유효한 직전 행과 비교해 경과 시간(시간)으로
+    나눈 값이므로, 수집이 한 번 빠져도 시간당 값이 유지되고 포스트가 바뀌면 섞이지 않습니다.
+    수집 시각/포스트가 기록되지 않은 예전 행은 참여율만 계산합니다.
+    """
+    values = raw[RAW_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    valid  = values.notna().all(axis=1)
+    frame  = pd.DataFrame({
+        "exposure": values["exposure"],
+        "reached": values["reached"],
+        "engagement": values["reactions"] + values["comments"] + values["reposts"],
+        "hours": _collected_hours(raw["collected_at"]),
+        "post": raw["activity_urn"].where(raw["activity_urn"].astype(str).str.strip() != ""),
+    })[valid]
+
+    exposure = frame["exposure"].to_numpy(dtype=float)
+    rate = np.divide(frame["engagement"].to_numpy(dtype=float), exposure,
+                     out=np.full_like(exposure, np.nan), where=exposure > 0)
+
+    # 포스트 없는 행은 groupby 에서 제외되어 직전 값이 NaN 이 됨
+    prev    = frame.groupby("post", sort=False)[["exposure", "reached", "engagement", "hours"]].shift(1)
+    elapsed = frame["hours"] - prev["hours"]
+    elapsed = elapsed.where(elapsed > 0)
+    growth  = (frame["exposure"] - prev["exposure"]) / prev["exposure"].where(prev["exposure"] > 0)
+
+    return pd.DataFrame({
+        "engagement_rate": pd.Series(rate, index=frame.index).round(4),
+        "exposure_per_hour": ((frame["exposure"] - prev["exposure"]) / elapsed).round(2),
+        "reached_per_hour": ((frame["reached"] - prev["reached"]) / elapsed).round(2),
+        "engagement_per_hour": ((frame["engagement"] - prev["engagement"]) / elapsed).round(2),
+        "exposure_growth_per_hour": (growth / elapsed).round(4),
+    }, index=frame.index).reindex(raw.index)
 
-def write_post_time_to_sheet(post_time: str):
-    service.spreadsheets().values().update(
-        spreadsheetId=SPREADSHEET_ID, range=f"{SHEET_NAME}!G2",
-        valueInputOption='USER_ENTERED', body={'values': [[post_time]]}
-    ).execute()
+def derived_metrics_update(spreadsheet_id=SPREADSHEET_ID, sheet_name=SHEET_NAME,
+                           deadline: RunDeadline = NO_DEADLINE) -> list[dict]:
+    """아직 파생 지표가 없는 마지막 구간만 계산해 범위 업데이트 목록으로 돌려줍니다."""
+    # H열(이미 계산된 행), C열(수집된 행 수), N열(포스트)을 한 번에 조회
+    ranges = [f"{sheet_name}!H4:H", f"{sheet_name}!C4:C", f"{sheet_name}!N4:N"]
+    counts = sheets_execute(service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id, ranges=ranges
+    ), deadline, "derived_metrics").get("valueRanges", [])
+    columns = [vr.get("values", []) for vr in counts] + [[]] * (len(ranges) - len(counts))
+    done, total = len(columns[0]), len(columns[1])
+    if done >= total:
+        return []
+
+    # 증감 계산에는 같은 포스트의 가장 가까운 유효 행(H열이 채워진 행)만 있으면 되므로
+    # 거기까지만 거슬러 올라가 읽음 (그 사이의 빈 H 행도 함께 읽혀 계산에 포함됨)
+    computed = columns[0]
+    posts = [r[0] if r else "" for r in columns[2]]
+    posts += [""] * (total - len(posts))
+    start, end = 4 + done, 3 + total
+    first = start
+    tail_post = posts[done]
+    if tail_post:
+        for i in range(done - 1, -1, -1):
+            if posts[i] != tail_post:
+                break
+            first = 4 + i
+            if computed[i] and computed[i][0] != "":
+                break
+
+    width = len(RAW_COLUMNS) + len(DERIVED_COLUMNS) + len(COLLECTION_COLUMNS)  # C:N
+    rows = sheets_execute(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=f"{sheet_name}!C{first}:N{end}",
+        valueRenderOption="UNFORMATTED_VALUE", dateTimeRenderOption="SERIAL_NUMBER"
+    ), deadline, "derived_metrics").get("values", [])
+    rows += [[]] * (end - first + 1 - len(rows))
+    sheet = pd.DataFrame([r + [""] * (width - len(r)) for r in rows],
+                         index=range(first, end + 1))
+    raw = sheet[list(range(len(RAW_COLUMNS))) + [width - 2, width - 1]]
+    raw.columns = RAW_COLUMNS + COLLECTION_COLUMNS
+
+    derived = compute_derived_metrics(raw).loc[start:]
+    values = derived.astype(object).where(derived.notna(), "").values.tolist()
+    updates = [{'range': f"{sheet_name}!H{start}:L{end}", 'values': values}]
+    if done == 0:
+        # 처음 계산할 때만 3행에 헤더 기록
+        updates.append({'range': f"{sheet_name}!H3:N3",
+                        'values': [DERIVED_COLUMNS + COLLECTION_COLUMNS]})
+    return updates
+
+def update_derived_metrics(results: list[dict], deadline: RunDeadline = NO_DEADLINE):
+    """기록된 시트마다 파생 지표 꼬리 구간을 계산해 스프레드시트별로 일괄 기록합니다."""
+    updates = {}
+    seen = set()
+    for result in results:
+        key = (result["target"]["spreadsheet_id"], result["target"]["sheet_name"])
+        if key in seen:
+            continue
+        seen.add(key)
+        update = derived_metrics_update(*key, deadline=deadline)
+        if update:
+            updates.setdefault(key[0], []).extend(update)
+    write_updates_to_sheets(updates, deadline)
 
 # ------------------------------------------------
 # 14. 쿠키 관리 함수 (새 함수 추가)
@@ -628,119 +1228,229 @@ def load_cookies(driver, path="linkedin_cookies.pkl"):
         return False
 
 # ------------------------------------------------
-# 15. 메인 (수정됨)
+# 15. 대상별 수집 (수정됨)
 # ------------------------------------------------
-def main():
-    dl_dir = os.path.join(os.path.expanduser("~"), "Downloads")
-    
-    # 프록시 설정 확인 (GitHub Actions에서 환경변수로 전달됨)
-    proxy = os.getenv("HTTPS_PROXY") or os.getenv("HTTP_PROXY")
-    if proxy:
-        print(f"[INFO] 프록시 설정 감지: {proxy}")
-    else:
-        print("[WARN] 프록시가 설정되지 않았습니다. LinkedIn 접속이 차단될 수 있습니다.")
-    
+def run_target(target: dict, index: int = 0, deadline: RunDeadline = NO_DEADLINE,
+               combined_memory: CombinedMemoryPeak | None = None) -> dict | None:
+    """한 계정의 세션을 띄워 Analytics XLSX를 내려받고 파싱합니다. 실패하면 None."""
+    name        = target["name"]
+    dl_dir      = target["download_dir"]
+    cookie_path = target["cookie_file"]
+    driver_kwargs = {"debug_port": 9222 + index}
+    os.makedirs(dl_dir, exist_ok=True)
+    print(f"[INFO] [{name}] 수집 시작")
+
+    def fail(message, screenshot=None):
+        # 예산이 바닥난 상태의 실패는 (타임아웃이 잘려서 난 것이므로) 현재 단계를 초과 단계로 기록
+        if deadline.remaining() <= 0:
+            deadline.record(name, stage)
+            message = f"{message} - 실행 시간 예산 초과 (단계: {stage})"
+        print(f"[ERROR] [{name}] {message}")
+        if screenshot:
+            try:
+                driver.save_screenshot(f"{name}_{screenshot}")
+            except (Exception, DeadlineExceeded):
+                pass  # 예산이 바닥나면 스크린샷 명령도 거부됨
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return None
+
+    driver = None
+    stage = "init_driver"
+    monitor = ChromeMemoryMonitor(combined=combined_memory)
     try:
-        driver = init_driver(dl_dir)
+        driver = init_driver_within(deadline, stage, dl_dir, **driver_kwargs)
+        monitor.attach(driver)
         
         # 쿠키 로드 시도
-        cookie_loaded = load_cookies(driver)
+        stage = "cookies"
+        bind_driver_deadline(driver, deadline, stage)
+        cookie_loaded = load_cookies(driver, cookie_path)
         if cookie_loaded:
+            bind_driver_deadline(driver, deadline, stage)
             driver.get("https://www.linkedin.com/feed/")
-            time.sleep(3)
+            deadline.sleep(3, stage)
             if "login" not in driver.current_url:
-                print("[INFO] 저장된 쿠키로 로그인 성공")
+                print(f"[INFO] [{name}] 저장된 쿠키로 로그인 성공")
             else:
-                print("[INFO] 쿠키 만료, 일반 로그인 시도")
+                print(f"[INFO] [{name}] 쿠키 만료, 일반 로그인 시도")
                 cookie_loaded = False
         
         # 쿠키 로드 실패 또는 만료 시 일반 로그인
         if not cookie_loaded:
-            if not login_linkedin(driver):
-                print("[ERROR] LinkedIn 로그인 실패")
-                driver.save_screenshot("login_failed.png")
-                driver.quit()
-                sys.exit(1)
-            print("자동 로그인 성공")
+            stage = "login"
+            bind_driver_deadline(driver, deadline, stage)
+            credentials = get_linkedin_credentials(
+                target["email_env"], target["password_env"], target["keychain_service"]
+            )
+            if not login_linkedin(driver, credentials, deadline):
+                return fail("LinkedIn 로그인 실패", "login_failed.png")
+            print(f"[INFO] [{name}] 자동 로그인 성공")
             
             # 로그인 성공 시 쿠키 저장
-            save_cookies(driver)
+            save_cookies(driver, cookie_path)
         
         # 보안 인증 확인
-        if not handle_login_verification(driver):
-            print("[ERROR] 보안 인증 페이지 감지됨")
-            driver.save_screenshot("security_challenge.png")
-            driver.quit()
-            sys.exit(1)
+        stage = "security_check"
+        bind_driver_deadline(driver, deadline, stage)
+        if not handle_login_verification(driver, deadline, f"{name}_"):
+            return fail("보안 인증 페이지 감지됨")
+
+        # 메모리 예산 확인 (초과 시 드라이버 재시작)
+        stage = "driver_recycle"
+        bind_driver_deadline(driver, deadline, stage)
+        driver = recycle_driver_if_needed(driver, monitor, dl_dir, cookie_path, deadline, **driver_kwargs)
 
         # URL 가져오기
-        url = get_analytics_url()
+        stage = "analytics_url"
+        url = get_analytics_url(target["spreadsheet_id"], target["sheet_name"], deadline)
         if not url:
-            print("[ERROR] Analytics URL을 가져오지 못함")
-            driver.quit()
-            sys.exit(1)
-        print("[INFO] Analytics URL:", url)
+            return fail("Analytics URL을 가져오지 못함")
+        print(f"[INFO] [{name}] Analytics URL:", url)
 
         # 페이지 로드
+        stage = "analytics_page"
+        bind_driver_deadline(driver, deadline, stage)
         driver.get(url)
         print("[INFO] 페이지 로드 시작...")
         
         # Analytics 페이지 로드 대기 (향상된 대기 로직)
-        if not wait_for_analytics_page(driver, timeout=90):
-            print("[ERROR] Analytics 페이지 로드 실패")
-            driver.save_screenshot("analytics_page_failed.png")
-            driver.quit()
-            sys.exit(1)
+        if not wait_for_analytics_page(driver, timeout=90, deadline=deadline, file_prefix=f"{name}_"):
+            return fail("Analytics 페이지 로드 실패", "analytics_page_failed.png")
             
         # 기존 로직 유지
-        wait_for_page_load(driver, timeout=60)
+        stage = "page_load"
+        bind_driver_deadline(driver, deadline, stage)
+        wait_for_page_load(driver, timeout=60, deadline=deadline)
         
+        # 메모리 예산 확인 (재시작된 경우 페이지 로드 다시 대기)
+        stage = "driver_recycle"
+        bind_driver_deadline(driver, deadline, stage)
+        recycled = recycle_driver_if_needed(driver, monitor, dl_dir, cookie_path, deadline, **driver_kwargs)
+        if recycled is not driver:
+            driver = recycled
+            stage = "page_load"
+            bind_driver_deadline(driver, deadline, stage)
+            wait_for_page_load(driver, timeout=60, deadline=deadline)
+
         # 디버깅을 위한 페이지 구조 분석
+        stage = "download"
+        bind_driver_deadline(driver, deadline, stage)
         analyze_page_structure(driver)
         
         # 다운로드 전 스크린샷
-        driver.save_screenshot("screen_before_download.png")
+        driver.save_screenshot(f"{name}_screen_before_download.png")
         
         # 다운로드 실행
-        if not execute_download(driver):
-            print("[ERROR] 다운로드 실패")
-            driver.save_screenshot("download_failed.png")
-            driver.quit()
-            sys.exit(1)
+        if not execute_download(driver, deadline=deadline):
+            return fail("다운로드 실패", "download_failed.png")
         
-        # 파일 처리 및 시트 업데이트
+        # 파일 처리
         xlsx = get_latest_xlsx(dl_dir)
         if not xlsx:
-            print("[ERROR] XLSX 파일을 찾지 못함")
-            driver.save_screenshot("no_xlsx_found.png")
-            driver.quit()
-            sys.exit(1)
+            return fail("XLSX 파일을 찾지 못함", "no_xlsx_found.png")
 
-        print("[INFO] 파일 경로:", xlsx)
+        print(f"[INFO] [{name}] 파일 경로:", xlsx)
         exposure, reached, reactions, comments, reposts, post_time = parse_excel(xlsx)
-        row = get_next_row_index()
-        write_metrics_to_sheet(exposure, reached, reactions, comments, reposts, row)
-        write_post_time_to_sheet(post_time)
-        print(f"[INFO] 시트 기록 완료 (행 {row})")
-
-        # 임시 파일 정리
-        try:
-            os.remove(xlsx)
-        except Exception as e:
-            print("임시 파일 삭제 실패:", e)
+        collected_at = (datetime.datetime.utcnow() + datetime.timedelta(hours=9)) \
+                           .strftime("%Y-%m-%d %H:%M:%S")
 
-        # 작업 완료
         driver.quit()
-        print("[INFO] 작업 완료")
+        return {
+            "target": target,
+            "metrics": (exposure, reached, reactions, comments, reposts),
+            "post_time": post_time,
+            # 파생 지표를 포스트별/경과 시간 기준으로 계산하기 위해 행마다 함께 기록
+            "collected_at": collected_at,
+            "activity_urn": url.rstrip("/").rsplit("/", 1)[-1],
+            "xlsx": xlsx,
+        }
         
+    except DeadlineExceeded as e:
+        stage = e.stage
+        return fail("작업 취소", "deadline_exceeded.png")
     except Exception as e:
-        print(f"[ERROR] 예기치 않은 오류 발생: {e}")
+        return fail(f"예기치 않은 오류 발생: {e}", "unexpected_error.png")
+    finally:
+        monitor.stop()
+        monitor.report(name)
+
+# ------------------------------------------------
+# 16. 메인 (수정됨)
+# ------------------------------------------------
+def main():
+    # 전체 실행의 마감 시각: 이후 모든 대기/드라이버/시트 호출은 남은 시간만 사용
+    deadline = RunDeadline(RUN_BUDGET_SEC)
+    dl_dir = os.path.join(os.path.expanduser("~"), "Downloads")
+    
+    # 프록시 설정 확인 (GitHub Actions에서 환경변수로 전달됨)
+    proxy = os.getenv("HTTPS_PROXY") or os.getenv("HTTP_PROXY")
+    if proxy:
+        print(f"[INFO] 프록시 설정 감지: {proxy}")
+    else:
+        print("[WARN] 프록시가 설정되지 않았습니다. LinkedIn 접속이 차단될 수 있습니다.")
+
+    try:
+        targets = load_targets(dl_dir)
+    except ValueError as e:  # json.JSONDecodeError 포함
+        print(f"[ERROR] 대상 설정 오류: {e}")
+        sys.exit(1)
+    started = time.monotonic()
+    print(f"[INFO] 실행 시간 예산: {RUN_BUDGET_SEC:.0f}초")
+
+    # 계정별 세션(드라이버/쿠키/다운로드 폴더)은 분리하고 동시에 실행
+    workers = MAX_WORKERS or len(targets)
+    combined_memory = CombinedMemoryPeak()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="target") as pool:
+        outcomes = list(pool.map(run_target, targets, range(len(targets)),
+                                 [deadline] * len(targets), [combined_memory] * len(targets)))
+    print(f"[INFO] 동시 실행 Chrome 최대 RSS 합계: {combined_memory.peak_rss_mb:.1f} MB "
+          f"(대상 {len(targets)}개, 동시 실행 {min(workers, len(targets))}개)")
+    results = [r for r in outcomes if r]
+
+    # 시트 기록은 모든 대상의 결과를 모아 스프레드시트별로 한 번에
+    written = set()  # 기록을 마친 스프레드시트 ID
+    if results:
         try:
-            driver.save_screenshot("unexpected_error.png")
-        except:
-            pass
-        driver.quit()
+            write_results_to_sheets(results, deadline, written)
+        except DeadlineExceeded as e:
+            deadline.record("sheets", e.stage)
+        except Exception as e:
+            print(f"[ERROR] 시트 기록 실패: {e}")
+    recorded = [r for r in results if r["target"]["spreadsheet_id"] in written]
+
+    # 파생 지표는 실패해도 원시 데이터 기록에는 영향 없음
+    if recorded:
+        try:
+            update_derived_metrics(recorded, deadline)
+        except DeadlineExceeded as e:
+            deadline.record("sheets", e.stage)
+        except Exception as e:
+            print(f"[WARN] 파생 지표 기록 실패: {e}")
+
+    for result in results:
+        name = result["target"]["name"]
+        if result in recorded:
+            print(f"[INFO] [{name}] 시트 기록 완료 (행 {result['row']})")
+        else:
+            print(f"[ERROR] [{name}] 시트에 기록되지 않음")
+        # 임시 파일 정리 (수집 값은 이미 파싱됨)
+        try:
+            os.remove(result["xlsx"])
+        except Exception as e:
+            print("임시 파일 삭제 실패:", e)
+
+    # 포기한 드라이버 기동이 뒤늦게 띄운 Chrome 정리 (daemon 스레드는 종료 시 그냥 사라짐)
+    reap_abandoned_driver_starts()
+
+    elapsed = time.monotonic() - started
+    for label, stage in deadline.exceeded:
+        print(f"[ERROR] [{label}] 실행 시간 예산({RUN_BUDGET_SEC:.0f}초) 초과 단계: {stage}")
+    print(f"[INFO] 작업 완료: 성공 {len(recorded)}/{len(targets)}, 소요 {elapsed:.1f}초")
+    if len(recorded) < len(targets) or deadline.exceeded:
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()